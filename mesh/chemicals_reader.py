@@ -1,15 +1,38 @@
 """Submodule providing a reader able to read the MESH descriptors."""
 
 import os
-from typing import Iterator, List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple
+import pyarrow as pa
 from mesh.reader import MESHReader
 from mesh.settings import DatasetSettings
-from mesh.utils import normalize_string, MaybeChemical
+from mesh.utils import normalize_string, MaybeChemical, ParsedCache
+
+# Schema of the chemicals rows stored in the on-disk cache.
+_CHEMICALS_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("unique_identifier", pa.string()),
+        ("name", pa.string()),
+        ("pharmacological_actions", pa.list_(pa.string())),
+        ("descriptors", pa.list_(pa.string())),
+    ]
+)
 
 
 class MESHChemical(MaybeChemical):
     """Class representing a MESH descriptor."""
 
+    __slots__ = (
+        "_name",
+        "_unique_identifier",
+        "_pharmacological_actions",
+        "_descriptors",
+        "_compound_id",
+        "_substance_id",
+        "_smiles",
+        "_inchikey",
+        "_inchi",
+    )
+
     def __init__(
         self,
         name: str,
@@ -112,6 +135,28 @@ class MESHChemical(MaybeChemical):
         }
 
 
+def _parse_chemical_record(
+    name: str, actions: Sequence[str], headings: Sequence[str]
+) -> Tuple[str, List[str], List[str]]:
+    """Return the name, pharmacological actions and descriptors of a chemical record."""
+    pharmacological_actions: List[str] = [
+        action.partition("-")[0] for action in actions
+    ]
+    descriptors: List[str] = []
+    descriptors_append = descriptors.append
+    for heading_group in headings:
+        for heading in heading_group.split("/"):
+            heading = heading.partition("-")[0].strip(" *")
+            # We classify the headings by their first character, which
+            # is cheaper than a call to startswith for each heading.
+            initial = heading[:1]
+            if initial == "D":
+                descriptors_append(heading)
+            elif initial != "Q":
+                raise ValueError(f"Invalid heading: {heading}")
+    return normalize_string(name), pharmacological_actions, descriptors
+
+
 class MESHChemicalsReader(MESHReader):
     """Class to read the MESH descriptors."""
 
@@ -125,32 +170,47 @@ class MESHChemicalsReader(MESHReader):
             verbose=settings.verbose,
         )
 
-    def __iter__(self) -> Iterator[MESHChemical]:
-        """Return the iterator."""
+    def iter_tuples(self) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+        """Return an iterator over the chemicals as tuples of identifier, name, actions and descriptors."""
+        cache = ParsedCache(self._path, "chemicals")
+        if cache.is_valid():
+            for unique_identifier, name, pharmacological_actions, descriptors in (
+                cache.rows()
+            ):
+                yield (
+                    unique_identifier,
+                    name,
+                    list(pharmacological_actions),
+                    list(descriptors),
+                )
+            return
+
+        yield from cache.store_rows(self._parse_tuples(), schema=_CHEMICALS_SCHEMA)
+
+    def _parse_tuples(self) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+        """Return an iterator over the chemicals parsed from the MESH dump."""
         for record in super().__iter__():
             assert (
                 record.record_type == "C"
             ), f"Invalid record type: {record.record_type}"
-            name = normalize_string(record["NM"][0])
-            pharmacological_actions = [
-                action.split("-")[0] for action in record.get("PA", [])
-            ]
-            descriptors: List[str] = []
-            for headings in record.get("HM", []):
-                for heading in headings.split("/"):
-                    heading = heading.split("-")[0].strip(" *")
-                    if heading.startswith("Q"):
-                        continue
-                    elif heading.startswith("D"):
-                        descriptors.append(heading)
-                    else:
-                        raise ValueError(f"Invalid heading: {heading}")
-
-            chemical = MESHChemical(
+            yield (
+                record.unique_identifier,
+                *_parse_chemical_record(
+                    record["NM"][0], record.get("PA", ()), record.get("HM", ())
+                ),
+            )
+
+    def __iter__(self) -> Iterator[MESHChemical]:
+        """Return the iterator."""
+        for (
+            unique_identifier,
+            name,
+            pharmacological_actions,
+            descriptors,
+        ) in self.iter_tuples():
+            yield MESHChemical(
                 name=name,
-                unique_identifier=record.unique_identifier,
+                unique_identifier=unique_identifier,
                 pharmacological_actions=pharmacological_actions,
                 descriptors=descriptors,
             )
-
-            yield chemical
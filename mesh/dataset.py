@@ -1,8 +1,10 @@
 """Submodule providing the Dataset class, representing an instance of the MESH dataset."""
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Union, FrozenSet
+from itertools import islice
 import os
 import shutil
+import subprocess
 import pandas as pd
 import compress_json
 from downloaders import BaseDownloader
@@ -11,6 +13,50 @@ import networkx as nx
 from mesh.settings import DatasetSettings
 from mesh.descriptors_reader import MESHDescriptorsReader, MESHDescriptor
 from mesh.chemicals_reader import MESHChemicalsReader, MESHChemical
+from mesh.enrichers import enrich_all
+from mesh.utils import load_package_json
+
+# Number of chemicals read and enriched at once while building the dataset.
+ENRICHMENT_BATCH_SIZE: int = 10_000
+
+
+class _NodesTable:
+    """Class accumulating the columns of a table of nodes."""
+
+    def __init__(self):
+        """Initialize the _NodesTable class."""
+        self._unique_identifiers: List[str] = []
+        self._names: List[str] = []
+        self._compound_ids: List[Optional[int]] = []
+        self._substance_ids: List[Optional[int]] = []
+        self._smiles: List[Optional[str]] = []
+        self._inchis: List[Optional[str]] = []
+        self._inchikeys: List[Optional[str]] = []
+
+    def append(self, entry: Union[MESHChemical, MESHDescriptor]) -> None:
+        """Append the provided entry to the table."""
+        self._unique_identifiers.append(entry.unique_identifier)
+        self._names.append(entry.chemical_name())
+        self._compound_ids.append(entry.compound_id())
+        self._substance_ids.append(entry.substance_id())
+        self._smiles.append(entry.smiles())
+        self._inchis.append(entry.inchi())
+        self._inchikeys.append(entry.inchikey())
+
+    def into_dataframe(self) -> pd.DataFrame:
+        """Return the table as a DataFrame."""
+        return pd.DataFrame(
+            {
+                "unique_identifier": self._unique_identifiers,
+                "name": self._names,
+                "compound_id": self._compound_ids,
+                "substance_id": self._substance_ids,
+                "smiles": self._smiles,
+                "inchi": self._inchis,
+                "inchikey": self._inchikeys,
+            },
+            copy=False,
+        )
 
 
 class Dataset:
@@ -31,36 +77,73 @@ class Dataset:
         self._mesh_dag: pd.DataFrame = mesh_dag
         self._metadata: Dict = metadata
 
+    def _tables(self) -> Dict[str, pd.DataFrame]:
+        """Return the tables of the dataset by name."""
+        return {
+            "chemicals": self._chemicals,
+            "descriptors": self._descriptors,
+            "chemicals_to_descriptors": self._chemicals_to_descriptors,
+            "mesh_dag": self._mesh_dag,
+        }
+
     def save(self, path: str, tarball: bool = False) -> None:
         """Save the dataset to disk."""
         os.makedirs(path, exist_ok=True)
-        self._chemicals.to_csv(os.path.join(path, "chemicals.csv"), index=False)
-        self._descriptors.to_csv(os.path.join(path, "descriptors.csv"), index=False)
-        self._chemicals_to_descriptors.to_csv(
-            os.path.join(path, "chemicals_to_descriptors.csv"), index=False
-        )
-        self._mesh_dag.to_csv(os.path.join(path, "mesh_dag.csv"), index=False)
+        for name, table in self._tables().items():
+            table.to_parquet(
+                os.path.join(path, f"{name}.parquet"),
+                engine="pyarrow",
+                compression="zstd",
+                index=False,
+            )
         compress_json.dump(self._metadata, os.path.join(path, "metadata.json"))
 
         if tarball:
-            os.system(f"tar -czf {path}.tar.gz {path}")
+            # When available, we compress the tarball with the parallel gzip
+            # implementation, which produces a standard gzip archive.
+            if shutil.which("pigz") is not None:
+                compression = [
+                    f"--use-compress-program=pigz -p {os.cpu_count() or 1}",
+                    "-cf",
+                ]
+            else:
+                compression = ["-czf"]
+            subprocess.run(
+                ["tar", *compression, f"{path}.tar.gz", path],
+                check=True,
+            )
             shutil.rmtree(path)
 
+    def export_csv(self, path: str) -> None:
+        """Export the tables of the dataset to disk as CSVs."""
+        os.makedirs(path, exist_ok=True)
+        for name, table in self._tables().items():
+            table.to_csv(os.path.join(path, f"{name}.csv"), index=False)
+        compress_json.dump(self._metadata, os.path.join(path, "metadata.json"))
+
     def to_networkx(self) -> nx.DiGraph:
         """Return the dataset as a networkx graph."""
         graph = nx.DiGraph()
 
-        for _, row in self._chemicals.iterrows():
-            graph.add_node(row["unique_identifier"], **row.to_dict())
-
-        for _, row in self._descriptors.iterrows():
-            graph.add_node(row["unique_identifier"], **row.to_dict())
+        # We feed the nodes and edges to networkx in bulk, as iterating
+        # over the rows of a DataFrame allocates a Series for each row.
+        for nodes in (self._chemicals, self._descriptors):
+            graph.add_nodes_from(
+                zip(
+                    nodes["unique_identifier"].to_numpy(),
+                    nodes.to_dict(orient="records"),
+                )
+            )
 
-        for _, row in self._chemicals_to_descriptors.iterrows():
-            graph.add_edge(row["chemical"], row["descriptor"])
+        graph.add_edges_from(
+            self._chemicals_to_descriptors[["chemical", "descriptor"]].itertuples(
+                index=False, name=None
+            )
+        )
 
-        for _, row in self._mesh_dag.iterrows():
-            graph.add_edge(row["child"], row["parent"])
+        graph.add_edges_from(
+            self._mesh_dag[["child", "parent"]].itertuples(index=False, name=None)
+        )
 
         return graph
 
@@ -71,9 +154,7 @@ class Dataset:
         verbose: bool = True,
     ) -> "Dataset":
         """Load the dataset from disk."""
-        preprocessed: List[Dict[str, str]] = compress_json.local_load(
-            "preprocessed.json"
-        )
+        preprocessed: List[Dict[str, str]] = load_package_json("preprocessed.json")
 
         version_metadata: Dict[str, str] = None
 
@@ -95,17 +176,17 @@ class Dataset:
             paths=[os.path.join(download_directory, f"{version}.tar.gz")],
         )
 
-        chemicals = pd.read_csv(
-            os.path.join(download_directory, version, "chemicals.csv")
+        chemicals = pd.read_parquet(
+            os.path.join(download_directory, version, "chemicals.parquet")
         )
-        descriptors = pd.read_csv(
-            os.path.join(download_directory, version, "descriptors.csv")
+        descriptors = pd.read_parquet(
+            os.path.join(download_directory, version, "descriptors.parquet")
         )
-        chemicals_to_descriptors = pd.read_csv(
-            os.path.join(download_directory, version, "chemicals_to_descriptors.csv")
+        chemicals_to_descriptors = pd.read_parquet(
+            os.path.join(download_directory, version, "chemicals_to_descriptors.parquet")
         )
-        mesh_dag = pd.read_csv(
-            os.path.join(download_directory, version, "mesh_dag.csv")
+        mesh_dag = pd.read_parquet(
+            os.path.join(download_directory, version, "mesh_dag.parquet")
         )
         metadata = compress_json.load(
             os.path.join(download_directory, version, "metadata.json")
@@ -123,10 +204,6 @@ class Dataset:
     def build(settings: DatasetSettings) -> "Dataset":
         """Rasterize the dataset."""
         assert isinstance(settings, DatasetSettings)
-        downloader = BaseDownloader(
-            process_number=1,
-            verbose=settings.verbose,
-        )
         paths: List[str] = []
         urls: List[str] = []
 
@@ -139,90 +216,106 @@ class Dataset:
             )
             urls.append(download_objective.url)
 
-        downloader.download(urls=urls, paths=paths)
+        # The downloads are I/O bound, so we retrieve them concurrently.
+        BaseDownloader(
+            process_number=max(1, min(len(urls), os.cpu_count() or 1)),
+            verbose=settings.verbose,
+        ).download(urls=urls, paths=paths)
 
         descriptors: List[MESHDescriptor] = list(
             MESHDescriptorsReader(settings=settings)
         )
 
-        chemicals: List[MESHChemical] = list(MESHChemicalsReader(settings=settings))
-
+        # We run all of the enrichers in a single pass over the entries.
         enrichment_procedures = settings.enrichment_procedures()
+        enrich_all(descriptors, enrichment_procedures)
 
-        for enricher in tqdm(
-            enrichment_procedures,
-            desc="Enriching dataset",
-            disable=not settings.verbose,
-            leave=False,
-            dynamic_ncols=True,
-        ):
-            for descriptor in descriptors:
-                enricher.enrich(entry=descriptor)
-            for chemical in chemicals:
-                enricher.enrich(entry=chemical)
-
-        # We construct the edges of the graph
+        # The chemicals make up most of the dataset, so rather than keeping
+        # all of them in memory we enrich the chemicals in batches as they
+        # are read and only retain the columns of the node table and of the
+        # edges.
+        chemicals_table = _NodesTable()
         chemical_sources: List[str] = []
-        descriptor_destinations: List[str] = []
-        descriptors_unique_ids = {
-            descriptor.unique_identifier for descriptor in descriptors
-        }
-        for chemical in tqdm(
-            chemicals,
-            desc="Constructing chemical to descriptor edges",
-            disable=not settings.verbose,
-            leave=False,
-            dynamic_ncols=True,
+        chemical_destinations: List[List[str]] = []
+
+        chemicals_reader = iter(MESHChemicalsReader(settings=settings))
+        for chemicals in iter(
+            lambda: list(islice(chemicals_reader, ENRICHMENT_BATCH_SIZE)), []
         ):
-            for descriptors_unique_id in chemical.descriptors:
-                # The user may have configured this Dataset to some descriptors.
-                if descriptors_unique_id in descriptors_unique_ids:
-                    chemical_sources.append(chemical.unique_identifier)
-                    descriptor_destinations.append(descriptors_unique_id)
-
-            for pharmacological_actions_unique_id in chemical.pharmacological_actions:
-                # The user may have configured this Dataset to exclude pharmacological actions.
-                if pharmacological_actions_unique_id in descriptors_unique_ids:
-                    chemical_sources.append(chemical.unique_identifier)
-                    descriptor_destinations.append(pharmacological_actions_unique_id)
+            enrich_all(chemicals, enrichment_procedures)
+            for chemical in chemicals:
+                chemicals_table.append(chemical)
+                # Each chemical is connected to both its descriptors and its
+                # pharmacological actions.
+                chemical_sources.append(chemical.unique_identifier)
+                chemical_destinations.append(
+                    chemical.descriptors + chemical.pharmacological_actions
+                )
 
+        # We expand the edges of the graph into a long table in a single pass.
         chemicals_to_descriptors = pd.DataFrame(
             {
                 "chemical": chemical_sources,
-                "descriptor": descriptor_destinations,
+                "descriptor": chemical_destinations,
             }
+        ).explode("descriptor")
+
+        # The user may have configured this Dataset to exclude some descriptors
+        # or pharmacological actions, so we only keep the edges towards the
+        # descriptors that have been loaded.
+        descriptors_unique_ids: FrozenSet[str] = frozenset(
+            descriptor.unique_identifier for descriptor in descriptors
+        )
+        chemicals_to_descriptors = chemicals_to_descriptors[
+            chemicals_to_descriptors["descriptor"].isin(descriptors_unique_ids)
+        ].reset_index(drop=True)
+
+        # The edge tables are made of a limited vocabulary of identifiers, so
+        # we store them as categoricals sharing the same categories, which
+        # replaces the string objects with integer codes.
+        unique_identifiers = pd.CategoricalDtype(
+            categories=sorted(descriptors_unique_ids.union(chemical_sources))
         )
+        chemicals_to_descriptors = chemicals_to_descriptors.astype(unique_identifiers)
 
         descriptors_sources: List[str] = []
         descriptors_destinations: List[str] = []
 
-        mesh_dag_numbers = {}
+        # While building the lookup, we also join the tree numbers of the
+        # parents of each descriptor once, so that the edge pass below does
+        # not need to walk and join the tree numbers a second time.
+        mesh_dag_numbers: Dict[str, str] = {}
+        parent_mesh_dag_numbers: List[List[str]] = []
         for descriptor in tqdm(
             descriptors,
             desc="Constructing mesh tree numbers lookup",
             disable=not settings.verbose,
             leave=False,
-            dynamic_ncols=True,
+            miniters=max(1, len(descriptors) // 1000),
+            mininterval=0.5,
         ):
+            descriptor_parents: List[str] = []
             for tree_number in descriptor.mesh_dag_numbers():
                 mesh_dag_numbers[".".join(tree_number)] = descriptor.unique_identifier
-
-        for descriptor in tqdm(
-            descriptors,
+                # We skip the root nodes, which have no parent.
+                if len(tree_number) > 1:
+                    descriptor_parents.append(".".join(tree_number[:-1]))
+            parent_mesh_dag_numbers.append(descriptor_parents)
+
+        for descriptor, descriptor_parents in tqdm(
+            zip(descriptors, parent_mesh_dag_numbers),
+            total=len(descriptors),
             desc="Constructing MESH DAG edges",
             disable=not settings.verbose,
             leave=False,
-            dynamic_ncols=True,
+            miniters=max(1, len(descriptors) // 1000),
+            mininterval=0.5,
         ):
             # In some instances, the parent tree number in MESH
             # since it treats it as a path on a tree from the root to the leaf,
             # while here we are treating it as a graph.
             parents: Set[str] = set()
-            for tree_number in descriptor.mesh_dag_numbers():
-                if len(tree_number) == 1:
-                    # Skip the root node.
-                    continue
-                tree_number = ".".join(tree_number[:-1])
+            for tree_number in descriptor_parents:
                 assert (
                     tree_number in mesh_dag_numbers
                 ), f"Tree number {tree_number} not found in descriptors."
@@ -241,22 +334,22 @@ class Dataset:
 
         mesh_dag = pd.DataFrame(
             {
-                "child": descriptors_sources,
-                "parent": descriptors_destinations,
+                "child": pd.Categorical(descriptors_sources, dtype=unique_identifiers),
+                "parent": pd.Categorical(
+                    descriptors_destinations, dtype=unique_identifiers
+                ),
             }
         )
 
-        # Next, we construct the node lists.
-
-        chemicals_df = pd.DataFrame([chemical.into_dict() for chemical in chemicals])
-
-        descriptors_df = pd.DataFrame(
-            [descriptor.into_dict() for descriptor in descriptors]
-        )
+        # Next, we construct the node lists. We fill the columns directly
+        # rather than building a dictionary for each of the entries.
+        descriptors_table = _NodesTable()
+        for descriptor in descriptors:
+            descriptors_table.append(descriptor)
 
         return Dataset(
-            chemicals=chemicals_df,
-            descriptors=descriptors_df,
+            chemicals=chemicals_table.into_dataframe(),
+            descriptors=descriptors_table.into_dataframe(),
             chemicals_to_descriptors=chemicals_to_descriptors,
             mesh_dag=mesh_dag,
             metadata=settings.into_dict(),
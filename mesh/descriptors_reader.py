@@ -1,15 +1,55 @@
 """Submodule providing a reader able to read the MESH descriptors."""
 
 import os
-from typing import Iterator, List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, FrozenSet, Tuple
+import pyarrow as pa
 from mesh.reader import MESHReader
 from mesh.settings import DatasetSettings
-from mesh.utils import normalize_string, MaybeChemical
+from mesh.utils import normalize_string, MaybeChemical, ParsedCache
+
+# Schema of the descriptors rows stored in the on-disk cache.
+_DESCRIPTORS_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("unique_identifier", pa.string()),
+        ("name", pa.string()),
+        ("tree_numbers", pa.list_(pa.string())),
+    ]
+)
+
+# The MESH DAG numbers of the categories whose descriptors may be chemicals.
+CHEMICAL_MESH_DAG_NUMBERS: FrozenSet[str] = frozenset(
+    {
+        "D01",
+        "D02",
+        "D03",
+        "D04",
+        "D05",
+        "D06",
+        "D08",
+        "D09",
+        "D10",
+        "D12",
+        "D13",
+        "D20",
+    }
+)
 
 
 class MESHDescriptor(MaybeChemical):
     """Class representing a MESH descriptor."""
 
+    __slots__ = (
+        "_name",
+        "_unique_identifier",
+        "_mesh_dag_numbers",
+        "_compound_id",
+        "_substance_id",
+        "_smiles",
+        "_inchi",
+        "_inchikey",
+        "_maybe_chemical",
+    )
+
     def __init__(
         self, name: str, unique_identifier: str, mesh_dag_numbers: List[List[str]]
     ):
@@ -22,6 +62,10 @@ class MESHDescriptor(MaybeChemical):
         self._smiles: Optional[str] = None
         self._inchi: Optional[str] = None
         self._inchikey: Optional[str] = None
+        self._maybe_chemical: bool = any(
+            mesh_dag_number[0] in CHEMICAL_MESH_DAG_NUMBERS
+            for mesh_dag_number in mesh_dag_numbers
+        )
 
     def __repr__(self) -> str:
         """Return the representation of the MESH descriptor."""
@@ -41,24 +85,7 @@ class MESHDescriptor(MaybeChemical):
 
     def maybe_chemical(self) -> bool:
         """Return whether the descriptor is a chemical."""
-        haystack = [
-            "D01",
-            "D02",
-            "D03",
-            "D04",
-            "D05",
-            "D06",
-            "D08",
-            "D09",
-            "D10",
-            "D12",
-            "D13",
-            "D20",
-        ]
-        return any(
-            mesh_dag_number[0] in haystack
-            for mesh_dag_number in self._mesh_dag_numbers
-        )
+        return self._maybe_chemical
 
     def compound_id(self) -> Optional[int]:
         """Return the PubChem Compound ID."""
@@ -131,23 +158,53 @@ class MESHDescriptorsReader(MESHReader):
             ),
             verbose=settings.verbose,
         )
-        self._allowed_mesh_dag_numbers: List[str] = settings.allowed_mesh_dag_numbers
-        self._allowed_root_letters: List[str] = settings.allowed_root_letters
+        self._allowed_mesh_dag_numbers: FrozenSet[str] = frozenset(
+            settings.allowed_mesh_dag_numbers
+        )
+        self._allowed_root_letters: FrozenSet[str] = frozenset(
+            settings.allowed_root_letters
+        )
 
-    def __iter__(self) -> Iterator[MESHDescriptor]:
-        """Return the iterator."""
+    def iter_tuples(self) -> Iterator[Tuple[str, str, List[str]]]:
+        """Return an iterator over the descriptors as tuples of identifier, name and tree numbers."""
+        # The tuples hold all of the tree numbers, as their filtering
+        # depends on the settings.
+        cache = ParsedCache(self._path, "descriptors")
+        if cache.is_valid():
+            for unique_identifier, name, tree_numbers in cache.rows():
+                yield unique_identifier, name, list(tree_numbers)
+            return
+
+        yield from cache.store_rows(self._parse_tuples(), schema=_DESCRIPTORS_SCHEMA)
+
+    def _parse_tuples(self) -> Iterator[Tuple[str, str, List[str]]]:
+        """Return an iterator over the descriptors parsed from the MESH dump."""
         for record in super().__iter__():
             assert record.record_type == "D"
-            name = normalize_string(record["MH"][0])
-            mesh_dag_numbers = [
-                tree_number.split(".")
-                for tree_number in record.get("MN", [])
-                if tree_number[0] in self._allowed_root_letters
-                and tree_number.split(".")[0] in self._allowed_mesh_dag_numbers
-            ]
+            yield (
+                record.unique_identifier,
+                normalize_string(record["MH"][0]),
+                record.get("MN", []),
+            )
+
+    def __iter__(self) -> Iterator[MESHDescriptor]:
+        """Return the iterator."""
+        allowed_root_letters = self._allowed_root_letters
+        allowed_mesh_dag_numbers = self._allowed_mesh_dag_numbers
+        for unique_identifier, name, tree_numbers in self.iter_tuples():
+            # We split each tree number once, and only after it has passed
+            # the cheaper check on its root letter.
+            mesh_dag_numbers: List[List[str]] = []
+            for tree_number in tree_numbers:
+                if tree_number[0] not in allowed_root_letters:
+                    continue
+                mesh_dag_number = tree_number.split(".")
+                if mesh_dag_number[0] not in allowed_mesh_dag_numbers:
+                    continue
+                mesh_dag_numbers.append(mesh_dag_number)
             descriptor = MESHDescriptor(
                 name=name,
-                unique_identifier=record.unique_identifier,
+                unique_identifier=unique_identifier,
                 mesh_dag_numbers=mesh_dag_numbers,
             )
 
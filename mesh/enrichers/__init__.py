@@ -3,6 +3,12 @@
 from mesh.enrichers.compound_id_enricher import CompoundIdEnricher
 from mesh.enrichers.smiles_enricher import SMILESEnricher
 from mesh.enrichers.inchikey_enricher import InChIKeyEnricher
-from mesh.enrichers.enricher import Enricher
+from mesh.enrichers.enricher import Enricher, enrich_all
 
-__all__ = ["CompoundIdEnricher", "SMILESEnricher", "InChIKeyEnricher", "Enricher"]
+__all__ = [
+    "CompoundIdEnricher",
+    "SMILESEnricher",
+    "InChIKeyEnricher",
+    "Enricher",
+    "enrich_all",
+]
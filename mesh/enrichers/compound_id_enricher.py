@@ -1,11 +1,14 @@
 """Submodule providing a Compound ID enricher for the MESH dataset."""
 
-from typing import Any, Dict
+from typing import Any, List, Optional, Set, Tuple
 import os
-from tqdm.auto import tqdm
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv
 from downloaders import BaseDownloader
 from mesh.enrichers.enricher import Enricher
-from mesh.utils import MaybeChemical
+from mesh.utils import MaybeChemical, sorted_lookup
 
 
 class CompoundIdEnricher(Enricher):
@@ -21,7 +24,7 @@ class CompoundIdEnricher(Enricher):
         sid_path = os.path.join(downloads_directory, "SID-MeSH.txt")
 
         BaseDownloader(
-            process_number=1,
+            process_number=2,
             verbose=verbose,
         ).download(
             [
@@ -34,45 +37,72 @@ class CompoundIdEnricher(Enricher):
             ],
         )
 
-        loading_bar = tqdm(
-            desc="Loading Compound ID mappings",
-            disable=not verbose,
-            leave=False,
-            dynamic_ncols=True,
+        # We store each mapping as a sorted array of MESH names and the
+        # parallel array of their PubChem IDs, which take a fraction of the
+        # memory of a dictionary, and look the names up by binary search.
+        self._compound_names, self._compound_ids = self._load_mappings(cid_path)
+        self._substance_names, self._substance_ids = self._load_mappings(sid_path)
+
+    @staticmethod
+    def _load_mappings(path: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the sorted encoded MESH names and their PubChem IDs in the provided file."""
+        # Each line holds a PubChem ID followed by one or more MESH names,
+        # all separated by tabs. As the number of columns varies, we read
+        # the whole lines with the multithreaded Arrow reader, and then
+        # tokenize them with the Arrow string kernels, so that the scan of
+        # the file never goes through the Python interpreter.
+        lines = csv.read_csv(
+            path,
+            read_options=csv.ReadOptions(column_names=["line"], block_size=64 << 20),
+            parse_options=csv.ParseOptions(delimiter="\x1f", quote_char=False),
+            convert_options=csv.ConvertOptions(
+                column_types={"line": pa.large_string()}
+            ),
+        )["line"].combine_chunks()
+        tokens = pc.split_pattern(pc.utf8_trim_whitespace(lines), "\t")
+        identifiers = pc.cast(pc.list_element(tokens, 0), pa.int64())
+        # We expand the lines listing several names, repeating their ID.
+        names = pc.list_slice(tokens, 1)
+        identifiers = pc.take(identifiers, pc.list_parent_indices(names))
+        # We store the names as UTF-8 bytes, which are more compact than
+        # strings and faster to compare.
+        names = pc.cast(pc.list_flatten(names), pa.large_binary()).to_numpy(
+            zero_copy_only=False
         )
-
-        self._compound_id_to_mesh: Dict[str, int] = {}
-
-        with open(cid_path, "r", encoding="utf-8") as file:
-            for line in file:
-                mappings = line.strip().split("\t")
-                compound_id = mappings[0]
-                mesh_compounds = mappings[1:]
-                for mesh_compound in mesh_compounds:
-                    self._compound_id_to_mesh[mesh_compound] = int(compound_id)
-                    loading_bar.update(1)
-
-        loading_bar.close()
-
-        loading_bar = tqdm(
-            desc="Loading Substance ID mappings",
-            disable=not verbose,
-            leave=False,
-            dynamic_ncols=True,
-        )
-
-        self._substance_id_to_mesh: Dict[str, int] = {}
-
-        with open(sid_path, "r", encoding="utf-8") as file:
-            for line in file:
-                mappings = line.strip().split("\t")
-                substance_id = mappings[0]
-                mesh_compounds = mappings[1:]
-                for mesh_compound in mesh_compounds:
-                    self._substance_id_to_mesh[mesh_compound] = int(substance_id)
-                    loading_bar.update(1)
-
-        loading_bar.close()
+        identifiers = identifiers.to_numpy()
+        # When a name appears multiple times, the last PubChem ID wins, so
+        # we keep the first occurrence of each name in the reversed arrays.
+        names, positions = np.unique(names[::-1], return_index=True)
+        return names, identifiers[::-1][positions].astype(np.int64)
+
+    @staticmethod
+    def _lookup(
+        names: np.ndarray, identifiers: np.ndarray, name: bytes
+    ) -> Optional[int]:
+        """Return the PubChem ID of the provided name, if any."""
+        position = np.searchsorted(names, name)
+        if position < len(names) and names[position] == name:
+            return int(identifiers[position])
+        return None
+
+    @staticmethod
+    def _lookup_batch(
+        names: np.ndarray, identifiers: np.ndarray, queries: np.ndarray
+    ) -> List[Optional[int]]:
+        """Return the PubChem IDs of the provided names, if any."""
+        if len(names) == 0:
+            return [None] * len(queries)
+        positions = sorted_lookup(names, queries)
+        return [
+            None if position == -1 else identifier
+            for identifier, position in zip(
+                identifiers[positions].tolist(), positions.tolist()
+            )
+        ]
+
+    def compound_ids(self) -> Set[int]:
+        """Return the set of Compound IDs that may be assigned to an entry."""
+        return set(self._compound_ids.tolist())
 
     def name(self):
         """Return the name of the enricher."""
@@ -80,18 +110,44 @@ class CompoundIdEnricher(Enricher):
 
     def enrich(self, entry: Any):
         """Enrich the row with the Compound ID field."""
-        if not isinstance(entry, MaybeChemical):
+        if not getattr(entry, "maybe_chemical_interface", False):
             return
 
         if not entry.maybe_chemical():
             return
 
-        chemical_name: str = entry.chemical_name()
-        compound_id: int = self._compound_id_to_mesh.get(chemical_name, None)
-        substance_id: int = self._substance_id_to_mesh.get(chemical_name, None)
+        chemical_name: bytes = entry.chemical_name().encode("utf-8")
+        compound_id: Optional[int] = self._lookup(
+            self._compound_names, self._compound_ids, chemical_name
+        )
+        substance_id: Optional[int] = self._lookup(
+            self._substance_names, self._substance_ids, chemical_name
+        )
 
         if compound_id is not None:
             entry.set_compound_id(compound_id)
 
         if substance_id is not None:
             entry.set_substance_id(substance_id)
+
+    def _enrich_chemicals(self, chemicals: List[MaybeChemical]):
+        """Enrich the provided chemicals with the Compound ID field."""
+        chemical_names = np.array(
+            [chemical.chemical_name().encode("utf-8") for chemical in chemicals],
+            dtype=object,
+        )
+
+        for chemical, compound_id, substance_id in zip(
+            chemicals,
+            self._lookup_batch(
+                self._compound_names, self._compound_ids, chemical_names
+            ),
+            self._lookup_batch(
+                self._substance_names, self._substance_ids, chemical_names
+            ),
+        ):
+            if compound_id is not None:
+                chemical.set_compound_id(compound_id)
+
+            if substance_id is not None:
+                chemical.set_substance_id(substance_id)
@@ -1,7 +1,8 @@
 """Submodule defining the Enricher interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
+from mesh.utils import MaybeChemical
 
 
 class Enricher(ABC):
@@ -14,3 +15,30 @@ class Enricher(ABC):
     @abstractmethod
     def enrich(self, entry: Any):
         """Enrich the data."""
+
+    def _enrich_chemicals(self, chemicals: List[MaybeChemical]):
+        """Enrich the provided chemicals, which have already been checked."""
+        for chemical in chemicals:
+            self.enrich(chemical)
+
+    def enrich_batch(self, entries: List[Any]):
+        """Enrich the provided batch of data."""
+        enrich_all(entries, [self])
+
+
+def enrich_all(entries: List[Any], enrichers: List[Enricher]):
+    """Enrich the provided batch of data with all of the provided enrichers."""
+    # We check the entries once for all of the enrichers, which then
+    # run one after the other on the same list of chemicals.
+    chemicals: List[MaybeChemical] = [
+        entry
+        for entry in entries
+        if getattr(entry, "maybe_chemical_interface", False)
+        and entry.maybe_chemical()
+    ]
+
+    if len(chemicals) == 0:
+        return
+
+    for enricher in enrichers:
+        enricher._enrich_chemicals(chemicals)
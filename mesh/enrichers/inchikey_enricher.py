@@ -1,11 +1,12 @@
 """Submodule providing a InChIKey enricher for the MESH dataset."""
 
-from typing import Any, Dict, Tuple
+from typing import Any, List, Optional, Set
 import os
-from tqdm.auto import tqdm
+import numpy as np
+import pyarrow as pa
 from downloaders import BaseDownloader
 from mesh.enrichers.enricher import Enricher
-from mesh.utils import MaybeChemical
+from mesh.utils import MaybeChemical, load_compound_table, lookup_chemicals
 
 
 class InChIKeyEnricher(Enricher):
@@ -15,34 +16,30 @@ class InChIKeyEnricher(Enricher):
         self,
         downloads_directory: str,
         verbose: bool = False,
+        compound_ids: Optional[Set[int]] = None,
     ):
         """Initialize the enricher."""
         path = os.path.join(downloads_directory, "CID-InChIKey.tsv.gz")
-        extracted_path = os.path.join(downloads_directory, "CID-InChIKey.tsv")
         BaseDownloader(
             process_number=1,
             verbose=verbose,
+            auto_extract=False,
         ).download(
             "https://ftp.ncbi.nlm.nih.gov/pubchem/Compound/Extras/CID-InChI-Key.gz",
             path,
         )
 
-        loading_bar = tqdm(
-            desc="Extracting InChIKey",
-            disable=not verbose,
-            leave=False,
-            dynamic_ncols=True,
+        table = load_compound_table(
+            path,
+            column_names=["compound_id", "inchi", "inchikey"],
+            compound_ids=compound_ids,
+            description="Loading InChIKey",
+            verbose=verbose,
         )
 
-        self._compound_id_to_inchi: Dict[int, Tuple[str, str]] = {}
-
-        with open(extracted_path, "r", encoding="utf-8") as file:
-            for line in file:
-                compound_id, inchi, inchikey = line.strip().split("\t")
-                self._compound_id_to_inchi[int(compound_id)] = (inchi, inchikey)
-                loading_bar.update(1)
-
-        loading_bar.close()
+        self._compound_ids: np.ndarray = table["compound_id"].to_numpy()
+        self._inchis: pa.ChunkedArray = table["inchi"]
+        self._inchikeys: pa.ChunkedArray = table["inchikey"]
 
     def name(self):
         """Return the name of the enricher."""
@@ -50,13 +47,20 @@ class InChIKeyEnricher(Enricher):
 
     def enrich(self, entry: Any):
         """Enrich the row with the InChIKey field."""
-        if not isinstance(entry, MaybeChemical):
+        if not getattr(entry, "maybe_chemical_interface", False):
             return
 
         if entry.compound_id() is None:
             return
 
-        (inchi, inchikey) = self._compound_id_to_inchi.get(entry.compound_id(), (None, None))
+        self._enrich_chemicals([entry])
 
-        if inchi is not None:
-            entry.set_inchi_and_inchikey(inchi, inchikey)
+    def _enrich_chemicals(self, chemicals: List[MaybeChemical]):
+        """Enrich the provided chemicals with the InChIKey field."""
+        chemicals, positions = lookup_chemicals(self._compound_ids, chemicals)
+        for chemical, inchi, inchikey in zip(
+            chemicals,
+            self._inchis.take(positions).to_pylist(),
+            self._inchikeys.take(positions).to_pylist(),
+        ):
+            chemical.set_inchi_and_inchikey(inchi, inchikey)
@@ -1,11 +1,12 @@
 """Submodule providing a SMILES enricher for the MESH dataset."""
 
-from typing import Any
+from typing import Any, List, Optional, Set
 import os
-from tqdm.auto import tqdm
+import numpy as np
+import pyarrow as pa
 from downloaders import BaseDownloader
 from mesh.enrichers.enricher import Enricher
-from mesh.utils import MaybeChemical
+from mesh.utils import MaybeChemical, load_compound_table, lookup_chemicals
 
 
 class SMILESEnricher(Enricher):
@@ -15,34 +16,29 @@ class SMILESEnricher(Enricher):
         self,
         downloads_directory: str,
         verbose: bool = False,
+        compound_ids: Optional[Set[int]] = None,
     ):
         """Initialize the enricher."""
         path = os.path.join(downloads_directory, "CID-SMILES.tsv.gz")
-        extracted_path = os.path.join(downloads_directory, "CID-SMILES.tsv")
         BaseDownloader(
             process_number=1,
             verbose=verbose,
+            auto_extract=False,
         ).download(
             "https://ftp.ncbi.nlm.nih.gov/pubchem/Compound/Extras/CID-SMILES.gz",
             path,
         )
 
-        loading_bar = tqdm(
-            desc="Extracting SMILES",
-            disable=not verbose,
-            leave=False,
-            dynamic_ncols=True,
+        table = load_compound_table(
+            path,
+            column_names=["compound_id", "smiles"],
+            compound_ids=compound_ids,
+            description="Loading SMILES",
+            verbose=verbose,
         )
 
-        self._compound_id_to_smiles = {}
-
-        with open(extracted_path, "r", encoding="utf-8") as file:
-            for line in file:
-                compound_id, smiles = line.strip().split("\t")
-                self._compound_id_to_smiles[int(compound_id)] = smiles
-                loading_bar.update(1)
-
-        loading_bar.close()
+        self._compound_ids: np.ndarray = table["compound_id"].to_numpy()
+        self._smiles: pa.ChunkedArray = table["smiles"]
 
     def name(self):
         """Return the name of the enricher."""
@@ -50,13 +46,18 @@ class SMILESEnricher(Enricher):
 
     def enrich(self, entry: Any):
         """Enrich the row with the SMILES field."""
-        if not isinstance(entry, MaybeChemical):
+        if not getattr(entry, "maybe_chemical_interface", False):
             return
 
         if entry.compound_id() is None:
             return
 
-        smiles: str = self._compound_id_to_smiles.get(entry.compound_id(), None)
+        self._enrich_chemicals([entry])
 
-        if smiles is not None:
-            entry.set_smiles(smiles)
+    def _enrich_chemicals(self, chemicals: List[MaybeChemical]):
+        """Enrich the provided chemicals with the SMILES field."""
+        chemicals, positions = lookup_chemicals(self._compound_ids, chemicals)
+        for chemical, smiles in zip(
+            chemicals, self._smiles.take(positions).to_pylist()
+        ):
+            chemical.set_smiles(smiles)
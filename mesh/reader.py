@@ -1,15 +1,37 @@
 """Submodule providing a reader able to iterate over the MESH formats."""
 
-from typing import List, Dict, Optional, Iterator
+from typing import List, Optional, Iterator, Tuple
+import os
+import re
+import sys
+import mmap
 from tqdm.auto import tqdm
 
+_RECORD_SEPARATOR: bytes = b"*NEWRECORD"
+
+# The keys that are handled separately from the other fields of a record.
+_KEY_RECTYPE: str = sys.intern("RECTYPE")
+_KEY_UI: str = sys.intern("UI")
+
+# Pattern matching the "KEY = value" lines of a MESH record. The keys may
+# contain spaces, as in "PRINT ENTRY", and the whitespace surrounding the
+# keys and the values is discarded, without ever crossing a line break.
+_LINE_PATTERN: re.Pattern = re.compile(
+    r"^[^\S\n]*([^=\n]*?\S)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 class MESHRecord:
     """Class representing a MESH record."""
 
+    __slots__ = ("_record", "_record_type", "_unique_identifier")
+
     def __init__(self):
         """Initialize the MESH record."""
-        self._record: Dict[str, List[str]] = {}
+        # The records hold few fields, so we store them as a flat list of
+        # key-value pairs, which is far lighter than a dictionary of lists
+        # and, at these sizes, as fast to scan.
+        self._record: List[Tuple[str, str]] = []
         self._record_type: Optional[str] = None
         self._unique_identifier: Optional[str] = None
 
@@ -55,24 +77,29 @@ class MESHRecord:
 
     def __contains__(self, key: str) -> bool:
         """Return whether the key is in the record."""
-        return key in self._record
+        for record_key, _ in self._record:
+            if record_key == key:
+                return True
+        return False
 
     def __getitem__(self, key: str) -> List[str]:
         """Return the value of the key."""
-        assert key in self._record, f"Key not found: {key}"
-        return self._record[key]
+        values = [value for record_key, value in self._record if record_key == key]
+        assert len(values) > 0, f"Key not found: {key}"
+        return values
 
     def get(self, key: str, default: Optional[List[str]] = None) -> Optional[List[str]]:
         """Return the value of the key or a default value."""
-        return self._record.get(key, default)
+        values = [value for record_key, value in self._record if record_key == key]
+        if len(values) == 0:
+            return default
+        return values
 
     def add_key_value(self, key: str, value: str):
         """Add a key-value pair."""
         assert len(key) > 0
         assert len(value) > 0
-        if key not in self._record:
-            self._record[key] = []
-        self._record[key].append(value)
+        self._record.append((key, value))
 
     def __repr__(self) -> str:
         """Return the string representation of the record."""
@@ -87,57 +114,65 @@ class MESHReader:
         self._path: str = path
         self._verbose: bool = verbose
 
+    @staticmethod
+    def _parse_record(block: str) -> MESHRecord:
+        """Return the MESH record described by the provided block of lines."""
+        record = MESHRecord()
+        # We extract all of the key-value pairs of the record with a single
+        # regular expression scan, rather than splitting it line by line.
+        for key, value in _LINE_PATTERN.findall(block):
+            # In some cases, the value is empty.
+            if len(value) == 0:
+                continue
+
+            # The keys come from a small vocabulary, so we intern them: all
+            # of the records then share the same key objects, which also
+            # makes the identity checks against the record type and unique
+            # identifier keys below valid.
+            key = sys.intern(key)
+
+            if key is _KEY_RECTYPE:
+                record.set_record_type(value)
+                continue
+
+            if key is _KEY_UI:
+                record.set_unique_identifier(value)
+                continue
+
+            record.add_key_value(key, value)
+
+        assert record.is_complete(), "Incomplete record."
+        return record
+
     def __iter__(self) -> Iterator[MESHRecord]:
         """Iterate over the MESH file."""
         loading_bar = tqdm(
             desc="Loading MESH records",
-            unit="record",
-            dynamic_ncols=True,
+            total=os.path.getsize(self._path),
+            unit="B",
+            unit_scale=True,
+            mininterval=0.5,
             leave=False,
             disable=not self._verbose,
         )
-        with open(self._path, "r", encoding="utf8") as file:
-            record: Optional[MESHRecord] = None
-            for line in file:
-                line = line.strip()
-
-                if len(line) == 0:
-                    continue
-
-                if line == "*NEWRECORD":
-                    if record is not None:
-                        loading_bar.update(1)
-                        assert record.is_complete(), "Incomplete record."
-                        yield record
-                    record = MESHRecord()
-                    continue
-
-                assert "=" in line, (
-                    f"Invalid line: {line}",
-                    "The line must contain ' = '",
-                )
-
-                key, value = line.split("=", 1)
-
-                value = value.strip()  # Remove leading and trailing whitespaces
-                key = key.strip()
-
-                # In some cases, the value is empty
-                if len(value) == 0:
-                    continue
-
-                assert len(key) > 0
-                assert len(value) > 0
-
-                if key == "RECTYPE":
-                    record.set_record_type(value)
-                    continue
-
-                if key == "UI":
-                    record.set_unique_identifier(value)
-                    continue
-
-                record.add_key_value(key, value)
 
-            if record.record_type is not None:
-                yield record
+        # Empty files cannot be memory mapped.
+        if os.path.getsize(self._path) == 0:
+            return
+
+        # The MESH dumps are hundreds of megabytes, so rather than decoding
+        # them line by line we memory map them, find the record boundaries
+        # on the raw bytes and decode each record in one go.
+        with open(self._path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            start = mapped.find(_RECORD_SEPARATOR)
+            while start != -1:
+                block_start = start + len(_RECORD_SEPARATOR)
+                end = mapped.find(b"\n" + _RECORD_SEPARATOR, block_start)
+                block_end = len(mapped) if end == -1 else end
+                # We report the progress in bytes, which gives the bar a
+                # known total without counting the records up front.
+                loading_bar.update(block_end - start)
+                yield self._parse_record(mapped[block_start:block_end].decode("utf8"))
+                start = end if end == -1 else end + 1
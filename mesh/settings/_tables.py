@@ -0,0 +1,183 @@
+"""Static tables of the settings, generated by tools/freeze_tables.py."""
+
+# This file is generated from the JSON tables, do not edit it by hand.
+
+from typing import Dict, Tuple
+
+CHEMICALS_AND_DRUGS_CODES: Tuple[Dict[str, str], ...] = (
+    {
+        "name": "Inorganic Chemicals",
+        "code": "D01",
+    },
+    {
+        "name": "Organic Chemicals",
+        "code": "D02",
+    },
+    {
+        "name": "Heterocyclic Compounds",
+        "code": "D03",
+    },
+    {
+        "name": "Polycyclic Compounds",
+        "code": "D04",
+    },
+    {
+        "name": "Macromolecular Substances",
+        "code": "D05",
+    },
+    {
+        "name": "Hormones, Hormone Substitutes, and Hormone Antagonists",
+        "code": "D06",
+    },
+    {
+        "name": "Enzymes and Coenzymes",
+        "code": "D08",
+    },
+    {
+        "name": "Carbohydrates",
+        "code": "D09",
+    },
+    {
+        "name": "Lipids",
+        "code": "D10",
+    },
+    {
+        "name": "Amino Acids, Peptides, and Proteins",
+        "code": "D12",
+    },
+    {
+        "name": "Nucleic Acids, Nucleotides, and Nucleosides",
+        "code": "D13",
+    },
+    {
+        "name": "Complex Mixtures",
+        "code": "D20",
+    },
+    {
+        "name": "Biological Factors",
+        "code": "D23",
+    },
+    {
+        "name": "Biomedical and Dental Materials",
+        "code": "D25",
+    },
+    {
+        "name": "Pharmaceutical Preparations",
+        "code": "D26",
+    },
+    {
+        "name": "Chemical Actions and Uses",
+        "code": "D27",
+    },
+)
+
+CODE_BY_NAME: Dict[str, str] = {
+    "Inorganic Chemicals": "D01",
+    "Organic Chemicals": "D02",
+    "Heterocyclic Compounds": "D03",
+    "Polycyclic Compounds": "D04",
+    "Macromolecular Substances": "D05",
+    "Hormones, Hormone Substitutes, and Hormone Antagonists": "D06",
+    "Enzymes and Coenzymes": "D08",
+    "Carbohydrates": "D09",
+    "Lipids": "D10",
+    "Amino Acids, Peptides, and Proteins": "D12",
+    "Nucleic Acids, Nucleotides, and Nucleosides": "D13",
+    "Complex Mixtures": "D20",
+    "Biological Factors": "D23",
+    "Biomedical and Dental Materials": "D25",
+    "Pharmaceutical Preparations": "D26",
+    "Chemical Actions and Uses": "D27",
+}
+
+VERSIONS_BY_ID: Dict[int, Dict[str, str]] = {
+    2011: {
+        "version": 2011,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2011/asciimesh/d2011.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2011/asciimesh/c2011.bin",
+    },
+    2012: {
+        "version": 2012,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2012/asciimesh/d2012.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2012/asciimesh/c2012.bin",
+    },
+    2013: {
+        "version": 2013,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2013/asciimesh/d2013.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2013/asciimesh/c2013.bin",
+    },
+    2014: {
+        "version": 2014,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2014/asciimesh/d2014.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2014/asciimesh/c2014.bin",
+    },
+    2015: {
+        "version": 2015,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2015/asciimesh/d2015.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2015/asciimesh/c2015.bin",
+    },
+    2016: {
+        "version": 2016,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2016/asciimesh/d2016.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2016/asciimesh/c2016.bin",
+    },
+    2017: {
+        "version": 2017,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2017/asciimesh/d2017.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2017/asciimesh/c2017.bin",
+    },
+    2018: {
+        "version": 2018,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2018/asciimesh/d2018.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2018/asciimesh/c2018.bin",
+    },
+    2019: {
+        "version": 2019,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2019/asciimesh/d2019.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2019/asciimesh/c2019.bin",
+    },
+    2020: {
+        "version": 2020,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2020/asciimesh/d2020.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2020/asciimesh/c2020.bin",
+    },
+    2021: {
+        "version": 2021,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2021/asciimesh/d2021.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2021/asciimesh/c2021.bin",
+    },
+    2022: {
+        "version": 2022,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2022/asciimesh/d2022.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2022/asciimesh/c2022.bin",
+    },
+    2023: {
+        "version": 2023,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2023/asciimesh/d2023.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2023/asciimesh/c2023.bin",
+    },
+    2024: {
+        "version": 2024,
+        "descriptors": "https://nlmpubs.nlm.nih.gov/projects/mesh/2024/asciimesh/20240101/d2024.bin",
+        "chemicals": "https://nlmpubs.nlm.nih.gov/projects/mesh/2024/asciimesh/20240101/c2024.bin",
+    },
+}
+
+ROOT_LETTER_BY_NAME: Dict[str, str] = {
+    "Anatomy": "A",
+    "Organisms": "B",
+    "Diseases": "C",
+    "Chemicals and Drugs": "D",
+    "Analytical, Diagnostic and Therapeutic Techniques and Equipment": "E",
+    "Psychiatry and Psychology": "F",
+    "Phenomena and Processes": "G",
+    "Disciplines and Occupations": "H",
+    "Anthropology, Education, Sociology and Social Phenomena": "I",
+    "Technology, Industry, Agriculture": "J",
+    "Humanities": "K",
+    "Information Science": "L",
+    "Named Groups": "M",
+    "Health Care": "N",
+    "Publication Characteristics": "V",
+    "Geographicals": "Z",
+}
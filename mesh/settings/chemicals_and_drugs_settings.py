@@ -1,8 +1,9 @@
 """Settings regarding the Chemicals and Drugs section of the MESH DAG."""
 
-from typing import List, Dict, Type
-import compress_json
+from typing import List, Dict, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
 from mesh.settings.submodule_settings import SubmoduleSettings
+from mesh.settings._tables import CHEMICALS_AND_DRUGS_CODES, CODE_BY_NAME
 from mesh.enrichers import (
     Enricher,
     CompoundIdEnricher,
@@ -14,12 +15,17 @@ from mesh.enrichers import (
 class ChemicalsAndDrugsSettings(SubmoduleSettings):
     """Class defining the settings for the Chemicals and Drugs section of the MESH dataset."""
 
+    __slots__ = (
+        "_included_codes",
+        "_include_smiles",
+        "_include_inchi_keys",
+    )
+
     def __init__(self):
         """Initialize the ChemicalsAndDrugsSettings class."""
-        self._included_codes: List[str] = []
-        self._codes: List[Dict[str, str]] = compress_json.local_load(
-            "chemicals_and_drugs_codes.json"
-        )
+        # We keep the included codes as the keys of a dictionary, which
+        # behaves as an insertion-ordered set and ignores repeated codes.
+        self._included_codes: Dict[str, None] = {}
         self._include_smiles: bool = False
         self._include_inchi_keys: bool = False
 
@@ -29,13 +35,13 @@ class ChemicalsAndDrugsSettings(SubmoduleSettings):
 
     def allowed_mesh_dag_numbers(self) -> List[str]:
         """Return a list of submodule names to include."""
-        return self._included_codes
+        return list(self._included_codes)
 
     def into_dict(self) -> Dict:
         """Return the submodule settings as a dictionary."""
         return {
             "root": self.root_name(),
-            "included_codes": self._included_codes,
+            "included_codes": list(self._included_codes),
             "include_smiles": self._include_smiles,
         }
 
@@ -43,40 +49,49 @@ class ChemicalsAndDrugsSettings(SubmoduleSettings):
         self, downloads_directory: str, verbose: bool
     ) -> List[Type[Enricher]]:
         """Return a list of enrichment procedures for the dataset."""
-        enrichers: List[Type[Enricher]] = []
-        if self._include_smiles or self._include_inchi_keys:
-            enrichers.append(
-                CompoundIdEnricher(
-                    downloads_directory=downloads_directory,
-                    verbose=verbose,
-                )
-            )
+        if not self._include_smiles and not self._include_inchi_keys:
+            return []
+
+        compound_id_enricher = CompoundIdEnricher(
+            downloads_directory=downloads_directory,
+            verbose=verbose,
+        )
 
+        # The SMILES and InChIKey mappings cover the whole of PubChem, while
+        # we can only ever look up the compounds associated to MESH entries,
+        # so we restrict the mappings to those compounds.
+        compound_ids = compound_id_enricher.compound_ids()
+
+        enricher_classes: List[Type[Enricher]] = []
         if self._include_smiles:
-            enrichers.append(
-                SMILESEnricher(
-                    downloads_directory=downloads_directory,
-                    verbose=verbose,
-                )
-            )
+            enricher_classes.append(SMILESEnricher)
 
         if self._include_inchi_keys:
-            enrichers.append(
-                InChIKeyEnricher(
-                    downloads_directory=downloads_directory,
-                    verbose=verbose,
-                )
-            )
-
-        return enrichers
+            enricher_classes.append(InChIKeyEnricher)
+
+        # Building an enricher is dominated by the download and loading of
+        # its PubChem mappings, so we build them concurrently. The Compound ID
+        # enricher comes first, as the other enrichers depend on the Compound
+        # ID it sets.
+        with ThreadPoolExecutor(max_workers=len(enricher_classes)) as executor:
+            return [
+                compound_id_enricher,
+                *executor.map(
+                    lambda enricher_class: enricher_class(
+                        downloads_directory=downloads_directory,
+                        verbose=verbose,
+                        compound_ids=compound_ids,
+                    ),
+                    enricher_classes,
+                ),
+            ]
 
     def _include_code(self, name: str):
         """Include a code in the dataset."""
-        for code in self._codes:
-            if code["name"] == name:
-                self._included_codes.append(code["code"])
-                return
-        raise ValueError(f"Code {name} not found.")
+        code: Optional[str] = CODE_BY_NAME.get(name)
+        if code is None:
+            raise ValueError(f"Code {name} not found.")
+        self._included_codes[code] = None
 
     def include_inorganic_chemicals(self) -> "ChemicalsAndDrugsSettings":
         """Include inorganic chemicals in the dataset."""
@@ -164,8 +179,9 @@ class ChemicalsAndDrugsSettings(SubmoduleSettings):
 
     def include_all_submodules(self) -> "ChemicalsAndDrugsSettings":
         """Include all codes in the dataset."""
-        for code in self._codes:
-            self._included_codes.append(code["code"])
+        self._included_codes.update(
+            dict.fromkeys(code["code"] for code in CHEMICALS_AND_DRUGS_CODES)
+        )
         return self
 
     def include_smiles(self) -> "ChemicalsAndDrugsSettings":
@@ -177,3 +193,4 @@ class ChemicalsAndDrugsSettings(SubmoduleSettings):
         """Return whether to include InChI Keys in the dataset."""
         self._include_inchi_keys = True
         return self
+
@@ -1,31 +1,69 @@
 """Submodule defining the settings for the MESH dataset to rasterize."""
 
-from typing import List, Type, Dict
+from typing import Any, List, Type, Dict, Optional, Tuple
+from itertools import chain
+import json
 import os
-import compress_json
 from mesh.settings.chemicals_and_drugs_settings import ChemicalsAndDrugsSettings
 from mesh.settings.submodule_settings import SubmoduleSettings
+from mesh.settings._tables import VERSIONS_BY_ID, ROOT_LETTER_BY_NAME
 from mesh.utils import DownloadObjective
 from mesh.enrichers import Enricher
 
 
+class _SettingsEncoder(json.JSONEncoder):
+    """JSON encoder serializing the submodule settings through their dictionaries."""
+
+    def default(self, o: Any) -> Any:
+        """Return a serializable version of the provided object."""
+        if isinstance(o, SubmoduleSettings):
+            return o.into_dict()
+        return super().default(o)
+
+
 class DatasetSettings:
     """Class defining the settings for the MESH dataset to rasterize."""
 
+    __slots__ = (
+        "_version",
+        "_version_id",
+        "_version_str",
+        "_descriptors_directory",
+        "_chemicals_directory",
+        "_roots",
+        "_downloads_directory",
+        "_verbose",
+        "_download_objectives",
+    )
+
     def __init__(self, version: int = 2024):
         """Initialize the DatasetSettings class."""
-        assert isinstance(version, int)
-        self._version: Dict[str, str] = None
-        for version_metadata in compress_json.local_load("versions.json"):
-            if version_metadata["version"] == version:
-                self._version = version_metadata
-                break
-        if self._version is None:
+        if __debug__ and not isinstance(version, int):
+            raise TypeError(f"The version must be an int, got {type(version)}.")
+        version_metadata: Optional[Dict[str, str]] = VERSIONS_BY_ID.get(version)
+        if version_metadata is None:
             raise ValueError(f"Version {version} not found.")
+        # The metadata is shared across the whole process, so we copy it
+        # to avoid changes made through into_dict leaking to other settings.
+        self._version: Dict[str, str] = dict(version_metadata)
+        self._version_id: int = self._version["version"]
+        self._version_str: str = str(self._version_id)
+
+        # The paths of the MESH files only depend on the version, so we
+        # join them once rather than on every access.
+        self._descriptors_directory: str = os.path.join(
+            self._version_str,
+            "descriptors.txt",
+        )
+        self._chemicals_directory: str = os.path.join(
+            self._version_str,
+            "chemicals.txt",
+        )
 
         self._roots: List[Type[SubmoduleSettings]] = []
         self._downloads_directory: str = "downloads"
         self._verbose: bool = False
+        self._download_objectives: Optional[Tuple[DownloadObjective, ...]] = None
 
     def enrichment_procedures(self) -> List[Enricher]:
         """Return a list of enrichment procedures for the dataset."""
@@ -45,27 +83,25 @@ class DatasetSettings:
     @property
     def allowed_root_letters(self) -> List[str]:
         """Return a list of allowed root letters."""
-        root_letters: List[str] = []
-        root_letters_metadata: List[Dict[str, str]] = compress_json.local_load(
-            "root_letters.json"
-        )
-        for root in self._roots:
-            for entry in root_letters_metadata:
-                if root.root_name() == entry["name"]:
-                    root_letters.append(entry["letter"])
-        return root_letters
+        return [
+            ROOT_LETTER_BY_NAME[root.root_name()]
+            for root in self._roots
+            if root.root_name() in ROOT_LETTER_BY_NAME
+        ]
 
     @property
     def allowed_mesh_dag_numbers(self) -> List[str]:
         """Return a list of allowed MeSH tree numbers."""
-        mesh_dag_numbers: List[str] = []
-        for root in self._roots:
-            mesh_dag_numbers.extend(root.allowed_mesh_dag_numbers())
-        return mesh_dag_numbers
+        return list(
+            chain.from_iterable(
+                root.allowed_mesh_dag_numbers() for root in self._roots
+            )
+        )
 
     def set_verbose(self, verbose: bool) -> "DatasetSettings":
         """Set the verbosity of the dataset."""
-        assert isinstance(verbose, bool)
+        if __debug__ and not isinstance(verbose, bool):
+            raise TypeError(f"The verbosity must be a bool, got {type(verbose)}.")
         self._verbose = verbose
         return self
 
@@ -77,6 +113,20 @@ class DatasetSettings:
             "downloads_directory": self._downloads_directory,
         }
 
+    def to_json(self, **kwargs: Any) -> str:
+        """Return the dataset settings as a JSON string."""
+        # We hand the roots to the encoder as they are, which serializes
+        # them one by one without building an intermediate list.
+        return json.dumps(
+            {
+                "version": self._version,
+                "roots": self._roots,
+                "downloads_directory": self._downloads_directory,
+            },
+            cls=_SettingsEncoder,
+            **kwargs,
+        )
+
     @property
     def downloads_directory(self) -> str:
         """Return the download directory for the dataset."""
@@ -85,48 +135,52 @@ class DatasetSettings:
     @property
     def version(self) -> int:
         """Return the version of the dataset."""
-        return self._version["version"]
+        return self._version_id
 
     @property
     def descriptors_directory(self) -> str:
         """Return the directory of the descriptors."""
-        return os.path.join(
-            str(self._version["version"]),
-            "descriptors.txt",
-        )
+        return self._descriptors_directory
 
     @property
     def chemicals_directory(self) -> str:
         """Return the directory of the chemicals."""
-        return os.path.join(
-            str(self._version["version"]),
-            "chemicals.txt",
-        )
+        return self._chemicals_directory
 
     def download_objectives(self) -> List[DownloadObjective]:
         """Return a list of download objectives for the dataset."""
-        return [
-            DownloadObjective(
-                url=self._version["descriptors"],
-                path=self.descriptors_directory,
-            ),
-            DownloadObjective(
-                url=self._version["chemicals"],
-                path=self.chemicals_directory,
+        # The download objectives only depend on the version, which cannot
+        # change after construction, so we build them once.
+        if self._download_objectives is None:
+            self._download_objectives = (
+                DownloadObjective(
+                    url=self._version["descriptors"],
+                    path=self.descriptors_directory,
+                ),
+                DownloadObjective(
+                    url=self._version["chemicals"],
+                    path=self.chemicals_directory,
+                ),
             )
-        ]
+        # We return a new list, so that the callers cannot alter the memo.
+        return list(self._download_objectives)
 
     def include_chemicals_and_drugs(
         self, settings: ChemicalsAndDrugsSettings
     ) -> "DatasetSettings":
         """Include diseases in the dataset."""
-        assert isinstance(settings, ChemicalsAndDrugsSettings)
+        if __debug__ and not isinstance(settings, ChemicalsAndDrugsSettings):
+            raise TypeError(
+                f"The settings must be ChemicalsAndDrugsSettings, got {type(settings)}."
+            )
         self._roots.append(settings)
         return self
 
     def set_downloads_directory(self, directory: str) -> "DatasetSettings":
         """Set the download directory for the dataset."""
-        assert isinstance(directory, str)
-        assert len(directory) > 0
+        if __debug__ and not isinstance(directory, str):
+            raise TypeError(f"The directory must be a str, got {type(directory)}.")
+        if __debug__ and len(directory) == 0:
+            raise ValueError("The directory must not be empty.")
         self._downloads_directory = directory
         return self
@@ -8,6 +8,8 @@ from mesh.enrichers import Enricher
 class SubmoduleSettings(ABC):
     """Interface for Submodule Settings."""
 
+    __slots__ = ()
+
     @abstractmethod
     def root_name(self) -> str:
         """Return the root name of the submodule."""
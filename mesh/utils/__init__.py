@@ -3,5 +3,18 @@
 from mesh.utils.download_objective import DownloadObjective
 from mesh.utils.normalize_string import normalize_string
 from mesh.utils.maybe_chemical import MaybeChemical
+from mesh.utils.parsed_cache import ParsedCache
+from mesh.utils.compound_table import load_compound_table
+from mesh.utils.sorted_lookup import sorted_lookup, lookup_chemicals
+from mesh.utils.package_json import load_package_json
 
-__all__ = ["DownloadObjective", "normalize_string", "MaybeChemical"]
+__all__ = [
+    "DownloadObjective",
+    "normalize_string",
+    "MaybeChemical",
+    "ParsedCache",
+    "load_compound_table",
+    "sorted_lookup",
+    "lookup_chemicals",
+    "load_package_json",
+]
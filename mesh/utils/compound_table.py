@@ -0,0 +1,80 @@
+"""Submodule providing a loader for the tab-separated PubChem compound tables."""
+
+from typing import List, Optional, Set
+import hashlib
+import os
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv
+from tqdm.auto import tqdm
+from mesh.utils.parsed_cache import ParsedCache
+
+
+def load_compound_table(
+    path: str,
+    column_names: List[str],
+    compound_ids: Optional[Set[int]] = None,
+    description: str = "Loading compounds",
+    verbose: bool = False,
+) -> pa.Table:
+    """Return the PubChem table at the provided path, sorted by Compound ID."""
+    # We only keep the compounds that may be looked up.
+    value_set: Optional[pa.Array] = None
+    salt: Optional[str] = None
+    if compound_ids is not None:
+        value_set = pa.array(sorted(compound_ids), type=pa.int64())
+        salt = hashlib.sha1(value_set.to_numpy().tobytes()).hexdigest()
+
+    # Parsing the PubChem tables takes minutes, so we keep the parsed table
+    # on disk and memory map it on subsequent runs, as long as neither the
+    # source file nor the requested compounds have changed.
+    cache = ParsedCache(
+        path,
+        name=os.path.basename(path).split(".")[0],
+        extension="feather",
+        salt=salt,
+    )
+    if cache.is_valid():
+        return cache.table()
+
+    # The first column holds the Compound IDs, while the others hold strings.
+    column_types = {column_names[0]: pa.int64()}
+    for column_name in column_names[1:]:
+        column_types[column_name] = pa.large_string()
+
+    # We stream the file in large blocks, so that the tokenization and
+    # the parsing of the Compound IDs happen in C over whole batches.
+    # Gzipped files are decompressed on the fly, as Arrow infers their
+    # compression from the extension of the path, so the archives are
+    # downloaded without being extracted to disk.
+    reader = csv.open_csv(
+        path,
+        read_options=csv.ReadOptions(column_names=column_names, block_size=64 << 20),
+        parse_options=csv.ParseOptions(delimiter="\t", quote_char=False),
+        convert_options=csv.ConvertOptions(column_types=column_types),
+    )
+
+    loading_bar = tqdm(
+        desc=description,
+        unit="compound",
+        disable=not verbose,
+        leave=False,
+        dynamic_ncols=True,
+    )
+
+    batches: List[pa.RecordBatch] = []
+    for batch in reader:
+        loading_bar.update(batch.num_rows)
+        if value_set is not None:
+            batch = batch.filter(pc.is_in(batch.column(0), value_set=value_set))
+        batches.append(batch)
+
+    loading_bar.close()
+
+    # We sort the table by Compound ID, so that the compounds can be
+    # looked up by binary search directly over the memory mapped columns.
+    table = pa.Table.from_batches(batches, schema=reader.schema).sort_by(
+        column_names[0]
+    )
+    cache.store_table(table)
+    return table
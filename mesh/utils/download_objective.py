@@ -1,11 +1,27 @@
 """Data class defining a download objective."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class DownloadObjective:
     """Data class defining a download objective."""
 
+    # We declare the slots by hand, as dataclass only generates them
+    # from Python 3.10 onwards.
+    __slots__ = ("path", "url")
+
     path: str
     url: str
+
+    def __getstate__(self) -> Tuple[str, ...]:
+        """Return the state of the download objective, used to pickle and copy it."""
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+    def __setstate__(self, state: Tuple[str, ...]) -> None:
+        """Restore the state of the download objective."""
+        # The instance is frozen, so we bypass its __setattr__ as the
+        # dataclasses generated with slots do.
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
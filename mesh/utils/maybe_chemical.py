@@ -7,6 +7,12 @@ from typing import Optional
 class MaybeChemical(ABC):
     """Interface for objects that at times are chemicals."""
 
+    __slots__ = ()
+
+    # Class-level flag marking the implementations of this interface, which
+    # is cheaper to probe with getattr than a call to isinstance.
+    maybe_chemical_interface: bool = True
+
     @abstractmethod
     def maybe_chemical(self) -> bool:
         """Return True if the object is a chemical."""
@@ -0,0 +1,16 @@
+"""Submodule providing a cached loader for the JSON files shipped with the package."""
+
+from functools import lru_cache
+from typing import Any
+import os
+import compress_json
+
+# Root directory of the package, against which the JSON paths are resolved.
+_PACKAGE_DIRECTORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=None)
+def load_package_json(path: str) -> Any:
+    """Return the JSON at the provided path within the package."""
+    # The decoded JSON is shared across all callers, so it must not be mutated.
+    return compress_json.load(os.path.join(_PACKAGE_DIRECTORY, path))
@@ -0,0 +1,117 @@
+"""Submodule providing an on-disk cache of the rows parsed from a source file."""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import os
+import compress_json
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+from pyarrow import parquet as pq
+
+# Version of the format of the cached rows, which must be bumped whenever
+# the parsers producing them change, so that the stale caches are rebuilt.
+PARSED_CACHE_FORMAT_VERSION: int = 2
+
+
+class ParsedCache:
+    """Class handling the on-disk cache of the rows parsed from a source file."""
+
+    def __init__(
+        self,
+        source_path: str,
+        name: str,
+        extension: str = "parquet",
+        salt: Optional[str] = None,
+    ):
+        """Initialize the ParsedCache class."""
+        directory = os.path.dirname(source_path)
+        self._source_path: str = source_path
+        self._cache_path: str = os.path.join(directory, f"{name}.{extension}")
+        self._manifest_path: str = os.path.join(directory, f"{name}.manifest.json")
+        self._salt: Optional[str] = salt
+
+    def _fingerprint(self) -> Dict[str, Any]:
+        """Return the fingerprint of the source file."""
+        stat = os.stat(self._source_path)
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "salt": self._salt,
+            "format": PARSED_CACHE_FORMAT_VERSION,
+        }
+
+    def is_valid(self) -> bool:
+        """Return whether the cache matches the current source file."""
+        if not os.path.exists(self._cache_path) or not os.path.exists(
+            self._manifest_path
+        ):
+            return False
+        return compress_json.load(self._manifest_path) == self._fingerprint()
+
+    def _invalidate(self) -> None:
+        """Remove the manifest of the cache, if any."""
+        # We remove the manifest before writing, so that an interrupted write
+        # cannot leave a stale manifest pointing to a partial cache.
+        if os.path.exists(self._manifest_path):
+            os.remove(self._manifest_path)
+
+    def _validate(self) -> None:
+        """Write the manifest of the cache."""
+        compress_json.dump(self._fingerprint(), self._manifest_path)
+
+    def _write(self, writer: Callable[[str], None]) -> None:
+        """Write the cache with the provided writer and its manifest."""
+        self._invalidate()
+        writer(self._cache_path)
+        self._validate()
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Return an iterator over the cached rows."""
+        return pd.read_parquet(self._cache_path).itertuples(index=False, name=None)
+
+    def store_rows(
+        self,
+        rows: Iterator[Tuple[Any, ...]],
+        schema: pa.Schema,
+        batch_size: int = 10_000,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Return an iterator over the provided rows, storing them in the cache."""
+        # We write the rows in batches as they are consumed, so that a
+        # cold parse never holds all of them in memory. The manifest is
+        # only written once all of the rows have been stored.
+        self._invalidate()
+        with pq.ParquetWriter(self._cache_path, schema) as writer:
+            batch: List[Tuple[Any, ...]] = []
+            for row in rows:
+                batch.append(row)
+                yield row
+                if len(batch) == batch_size:
+                    writer.write_batch(_into_record_batch(batch, schema))
+                    batch = []
+            if len(batch) > 0:
+                writer.write_batch(_into_record_batch(batch, schema))
+        self._validate()
+
+    def table(self) -> pa.Table:
+        """Return the cached Arrow table, memory mapped from disk."""
+        return feather.read_table(self._cache_path, memory_map=True)
+
+    def store_table(self, table: pa.Table) -> None:
+        """Store the provided Arrow table in the cache."""
+        # The table is left uncompressed, so that it can be memory mapped.
+        self._write(
+            lambda path: feather.write_feather(table, path, compression="uncompressed")
+        )
+
+
+def _into_record_batch(
+    rows: List[Tuple[Any, ...]], schema: pa.Schema
+) -> pa.RecordBatch:
+    """Return the provided rows as a record batch with the provided schema."""
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(column, type=field.type)
+            for column, field in zip(zip(*rows), schema)
+        ],
+        schema=schema,
+    )
@@ -0,0 +1,34 @@
+"""Submodule providing binary search lookups over sorted arrays."""
+
+from typing import List, Tuple
+import numpy as np
+from mesh.utils.maybe_chemical import MaybeChemical
+
+
+def sorted_lookup(keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Return the positions of the queries in the sorted keys, or -1 when missing."""
+    if len(keys) == 0:
+        return np.full(len(queries), -1, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(keys, queries), len(keys) - 1)
+    return np.where(keys[positions] == queries, positions, -1)
+
+
+def lookup_chemicals(
+    compound_ids: np.ndarray, chemicals: List[MaybeChemical]
+) -> Tuple[List[MaybeChemical], np.ndarray]:
+    """Return the chemicals found in the sorted Compound IDs and their positions."""
+    # Only the chemicals with a Compound ID can be enriched. As the PubChem
+    # tables are sorted by Compound ID, we look them up by binary search
+    # rather than building dictionaries, so that the enrichers only read
+    # the memory mapped columns at the positions that were found.
+    chemicals = [
+        chemical for chemical in chemicals if chemical.compound_id() is not None
+    ]
+    positions = sorted_lookup(
+        compound_ids,
+        np.array([chemical.compound_id() for chemical in chemicals], dtype=np.int64),
+    )
+    found = positions != -1
+    return [
+        chemical for chemical, is_found in zip(chemicals, found.tolist()) if is_found
+    ], positions[found]
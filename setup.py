@@ -58,7 +58,9 @@ setup(
     install_requires=[
         "downloaders",
         "tqdm",
+        "numpy",
         "pandas",
+        "pyarrow",
         "networkx",
         "compress_json",
     ],
@@ -0,0 +1,13 @@
+"""Test suite for the DownloadObjective data class."""
+
+import copy
+import pickle
+from mesh.utils import DownloadObjective
+
+
+def test_download_objective_round_trip():
+    """Test that download objectives survive pickling and copying."""
+    download_objective = DownloadObjective(path="a", url="b")
+    assert pickle.loads(pickle.dumps(download_objective)) == download_objective
+    assert copy.copy(download_objective) == download_objective
+    assert copy.deepcopy(download_objective) == download_objective
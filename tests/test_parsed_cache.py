@@ -0,0 +1,38 @@
+"""Test suite for the on-disk cache of the parsed rows."""
+
+import os
+import pyarrow as pa
+from mesh.utils import ParsedCache
+
+_SCHEMA = pa.schema([("name", pa.string()), ("values", pa.list_(pa.string()))])
+
+
+def test_parsed_cache_round_trip(tmp_path):
+    """Test that the stored rows are read back and invalidated with the source."""
+    source_path = os.path.join(tmp_path, "source.bin")
+    with open(source_path, "w", encoding="utf8") as file:
+        file.write("source")
+    rows = [("a", ["x", "y"]), ("b", []), ("c", ["z"])]
+    cache = ParsedCache(source_path, "rows")
+    assert not cache.is_valid()
+    assert list(cache.store_rows(iter(rows), schema=_SCHEMA, batch_size=2)) == rows
+    assert cache.is_valid()
+    assert [
+        (name, list(values)) for name, values in ParsedCache(source_path, "rows").rows()
+    ] == rows
+
+    with open(source_path, "a", encoding="utf8") as file:
+        file.write(" changed")
+    assert not cache.is_valid()
+
+
+def test_parsed_cache_interrupted_store(tmp_path):
+    """Test that a partially consumed store does not validate the cache."""
+    source_path = os.path.join(tmp_path, "source.bin")
+    with open(source_path, "w", encoding="utf8") as file:
+        file.write("source")
+    cache = ParsedCache(source_path, "rows")
+    stored = cache.store_rows(iter([("a", []), ("b", [])]), schema=_SCHEMA)
+    next(stored)
+    stored.close()
+    assert not cache.is_valid()
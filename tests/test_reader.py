@@ -0,0 +1,40 @@
+"""Test suite for the parsing of the MESH records."""
+
+import os
+from mesh.reader import MESHReader
+
+
+def test_reader_parses_records(tmp_path):
+    """Test that the reader parses multi-word keys and indented lines."""
+    path = os.path.join(tmp_path, "records.bin")
+    with open(path, "w", encoding="utf8") as file:
+        file.write(
+            "*NEWRECORD\n"
+            "RECTYPE = D\n"
+            "MH = Calcimycin\n"
+            "  MN = D03.633.100\n"
+            "PRINT ENTRY = A-23187|T109|FX|ABBR|NRW|UNK (19XX)|741102|abbcdef\n"
+            "EMPTY = \n"
+            "UI = D000001\n"
+            "\n"
+            "*NEWRECORD\n"
+            "RECTYPE = C\n"
+            "NM = x = y\n"
+            "UI = C000002\n"
+        )
+
+    descriptor, chemical = list(MESHReader(path))
+
+    assert descriptor.record_type == "D"
+    assert descriptor.unique_identifier == "D000001"
+    assert descriptor["MH"] == ["Calcimycin"]
+    assert descriptor["MN"] == ["D03.633.100"]
+    assert "PRINT ENTRY" in descriptor
+    assert descriptor["PRINT ENTRY"] == [
+        "A-23187|T109|FX|ABBR|NRW|UNK (19XX)|741102|abbcdef"
+    ]
+    assert "EMPTY" not in descriptor
+
+    assert chemical.record_type == "C"
+    assert chemical.unique_identifier == "C000002"
+    assert chemical["NM"] == ["x = y"]
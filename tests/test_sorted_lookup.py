@@ -0,0 +1,40 @@
+"""Test suite for the lookup of the queries in sorted keys."""
+
+import numpy as np
+from mesh.utils import sorted_lookup, lookup_chemicals
+
+
+def test_sorted_lookup():
+    """Test that the found queries map back to their keys and the missing ones to -1."""
+    keys = np.array([2, 3, 5, 7, 11])
+    queries = np.array([7, 1, 2, 12, 5, 6])
+    positions = sorted_lookup(keys, queries)
+    assert positions.tolist() == [3, -1, 0, -1, 2, -1]
+    found = positions != -1
+    assert (keys[positions[found]] == queries[found]).all()
+
+
+def test_sorted_lookup_empty_keys():
+    """Test that no query is found among empty keys."""
+    positions = sorted_lookup(np.array([], dtype=np.int64), np.array([1, 2]))
+    assert positions.tolist() == [-1, -1]
+
+
+class _Chemical:
+    """Chemical with an optional Compound ID."""
+
+    def __init__(self, compound_id):
+        """Initialize the chemical."""
+        self._compound_id = compound_id
+
+    def compound_id(self):
+        """Return the Compound ID of the chemical."""
+        return self._compound_id
+
+
+def test_lookup_chemicals():
+    """Test that only the chemicals with a known Compound ID are returned."""
+    chemicals = [_Chemical(5), _Chemical(None), _Chemical(4), _Chemical(2)]
+    found, positions = lookup_chemicals(np.array([2, 3, 5]), chemicals)
+    assert found == [chemicals[0], chemicals[3]]
+    assert positions.tolist() == [2, 0]
@@ -0,0 +1,88 @@
+"""Script freezing the static JSON tables of the settings into a Python module.
+
+The generated module holds the tables as Python literals, which are loaded
+from the bytecode cache at import time without any decoding. Run it from
+the root of the repository whenever one of the JSON tables changes:
+
+    python tools/freeze_tables.py
+"""
+
+from typing import Any
+import json
+import os
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_DIRECTORY: str = os.path.join(ROOT, "mesh", "settings")
+
+
+def load(name: str) -> Any:
+    """Return the JSON table with the provided name."""
+    with open(os.path.join(SETTINGS_DIRECTORY, name), "r", encoding="utf8") as file:
+        return json.load(file)
+
+
+def to_literal(value: Any, depth: int = 0) -> str:
+    """Return the provided JSON value as a Python literal."""
+    indentation = "    " * (depth + 1)
+    if isinstance(value, dict):
+        items = [
+            f"{indentation}{to_literal(key)}: {to_literal(item, depth + 1)},\n"
+            for key, item in value.items()
+        ]
+        return "{\n" + "".join(items) + "    " * depth + "}"
+    if isinstance(value, (list, tuple)):
+        items = [f"{indentation}{to_literal(item, depth + 1)},\n" for item in value]
+        return "(\n" + "".join(items) + "    " * depth + ")"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+def literal(name: str, annotation: str, value: Any) -> str:
+    """Return the assignment of the provided value as a Python literal."""
+    return f"\n{name}: {annotation} = {to_literal(value)}\n"
+
+
+def main():
+    """Write the frozen tables module."""
+    codes = tuple(load("chemicals_and_drugs_codes.json"))
+    versions = load("versions.json")
+    root_letters = load("root_letters.json")
+
+    path = os.path.join(SETTINGS_DIRECTORY, "_tables.py")
+    with open(path, "w", encoding="utf8") as file:
+        file.write(
+            '"""Static tables of the settings, generated by tools/freeze_tables.py."""\n'
+            "\n"
+            "# This file is generated from the JSON tables, do not edit it by hand.\n"
+            "\n"
+            "from typing import Dict, Tuple\n"
+        )
+        file.write(
+            literal("CHEMICALS_AND_DRUGS_CODES", "Tuple[Dict[str, str], ...]", codes)
+        )
+        file.write(
+            literal(
+                "CODE_BY_NAME",
+                "Dict[str, str]",
+                {code["name"]: code["code"] for code in codes},
+            )
+        )
+        file.write(
+            literal(
+                "VERSIONS_BY_ID",
+                "Dict[int, Dict[str, str]]",
+                {version["version"]: version for version in versions},
+            )
+        )
+        file.write(
+            literal(
+                "ROOT_LETTER_BY_NAME",
+                "Dict[str, str]",
+                {entry["name"]: entry["letter"] for entry in root_letters},
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()